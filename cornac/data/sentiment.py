@@ -13,8 +13,53 @@
 # limitations under the License.
 # ============================================================================
 
+from array import array
+from collections.abc import Mapping
+
+import numpy as np
+
 from . import Modality
-from collections import OrderedDict
+
+
+class SentimentIndex(Mapping):
+    """Read-only mapping {row_idx: {col_idx: sentiment_idx}} (e.g., user -> item -> sentiment)
+    backed by CSR-like arrays instead of one dictionary per row.
+
+    Parameters
+    ----------
+    rows: numpy.array, required
+        Row indices (e.g., users) of the sentiment records.
+
+    cols: numpy.array, required
+        Column indices (e.g., items) of the sentiment records.
+
+    sentiment_ids: numpy.array, required
+        Indices of the sentiment records.
+    """
+
+    def __init__(self, rows, cols, sentiment_ids):
+        num_rows = rows.max() + 1 if len(rows) > 0 else 0
+        self.indptr = np.zeros(num_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=num_rows), out=self.indptr[1:])
+        # stable sorting keeps the records of each row in their original order
+        order = np.argsort(rows, kind='stable')
+        self.indices = cols[order]
+        self.sentiment_ids = sentiment_ids[order]
+
+    def __getitem__(self, row_idx):
+        # only integer keys exist, others must be missing (not failing) as in a dict
+        if (not isinstance(row_idx, (int, np.integer))
+                or not 0 <= row_idx < len(self.indptr) - 1
+                or self.indptr[row_idx] == self.indptr[row_idx + 1]):
+            raise KeyError(row_idx)
+        start, end = self.indptr[row_idx], self.indptr[row_idx + 1]
+        return dict(zip(self.indices[start:end].tolist(), self.sentiment_ids[start:end].tolist()))
+
+    def __iter__(self):
+        return iter(np.flatnonzero(np.diff(self.indptr)).tolist())
+
+    def __len__(self):
+        return int(np.count_nonzero(np.diff(self.indptr)))
 
 
 class SentimentModality(Modality):
@@ -29,7 +74,7 @@ class SentimentModality(Modality):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.raw_data = kwargs.get('data', OrderedDict())
+        self.raw_data = kwargs.get('data', [])
 
     @property
     def sentiment(self):
@@ -82,29 +127,38 @@ class SentimentModality(Modality):
         self.__opinion_id_map = input_opinion_id_map
 
     def _build_sentiment(self, uid_map, iid_map, dok_matrix):
-        self.user_sentiment = OrderedDict()
-        self.item_sentiment = OrderedDict()
-        aid_map = OrderedDict()
-        oid_map = OrderedDict()
-        sentiment = OrderedDict()
+        # typed accumulators, their buffers are wrapped as numpy arrays without copying
+        user_indices = array('i')
+        item_indices = array('i')
+        sentiment_indices = array('i')
+        aid_map = {}
+        oid_map = {}
+        sentiment = {}
+
+        # bind frequently used methods to local names for the loop below
+        get_user_idx, get_item_idx = uid_map.get, iid_map.get
+        add_user_idx, add_item_idx = user_indices.append, item_indices.append
+        add_sentiment_idx = sentiment_indices.append
+        get_aspect_idx, get_opinion_idx = aid_map.setdefault, oid_map.setdefault
+
         for idx, (raw_uid, raw_iid, sentiment_tuples) in enumerate(self.raw_data):
-            user_idx = uid_map.get(raw_uid, None)
-            item_idx = iid_map.get(raw_iid, None)
+            user_idx = get_user_idx(raw_uid, None)
+            item_idx = get_item_idx(raw_iid, None)
             if user_idx is None or item_idx is None or dok_matrix[user_idx, item_idx] == 0:
                 continue
-            user_dict = self.user_sentiment.setdefault(user_idx, OrderedDict())
-            user_dict[item_idx] = idx
-            item_dict = self.item_sentiment.setdefault(item_idx, OrderedDict())
-            item_dict[user_idx] = idx
-
-            mapped_tup = []
-            for tup in sentiment_tuples:
-                aspect, opinion, polarity = tup[0], tup[1], float(tup[2])
-                aspect_idx = aid_map.setdefault(aspect, len(aid_map))
-                opinion_idx = oid_map.setdefault(opinion, len(oid_map))
-                mapped_tup.append((aspect_idx, opinion_idx, polarity))
-            sentiment.setdefault(idx, mapped_tup)
-
+            add_user_idx(user_idx)
+            add_item_idx(item_idx)
+            add_sentiment_idx(idx)
+
+            sentiment[idx] = [(get_aspect_idx(tup[0], len(aid_map)),
+                               get_opinion_idx(tup[1], len(oid_map)),
+                               float(tup[2])) for tup in sentiment_tuples]
+
+        user_indices = np.frombuffer(user_indices, dtype=np.int32)
+        item_indices = np.frombuffer(item_indices, dtype=np.int32)
+        sentiment_indices = np.frombuffer(sentiment_indices, dtype=np.int32)
+        self.user_sentiment = SentimentIndex(user_indices, item_indices, sentiment_indices)
+        self.item_sentiment = SentimentIndex(item_indices, user_indices, sentiment_indices)
         self.sentiment = sentiment
         self.aspect_id_map = aid_map
         self.opinion_id_map = oid_map
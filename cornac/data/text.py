@@ -13,8 +13,10 @@
 # limitations under the License.
 # ============================================================================
 
-from typing import List, Dict, Callable, Union
-from collections import defaultdict, Counter, OrderedDict
+from typing import List, Dict, Callable, Union, Iterable
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+import multiprocessing
 import string
 import pickle
 import re
@@ -25,6 +27,7 @@ import scipy.sparse as sp
 from . import FeatureModality
 from .modality import fallback_feature
 from ..utils import normalize
+from ..utils.fast_sparse_funcs import csr_count_ids, gather_sequences
 
 __all__ = ['Tokenizer',
            'BaseTokenizer',
@@ -34,6 +37,26 @@ __all__ = ['Tokenizer',
 
 PAD, UNK, BOS, EOS = '<PAD>', '<UNK>', '<BOS>', '<EOS>'
 SPECIAL_TOKENS = [PAD, UNK, BOS, EOS]
+_SPECIAL_TOKENS_SET = frozenset(SPECIAL_TOKENS)
+
+# Minimum number of documents to be tokenized in parallel,
+# smaller corpora are not worth the cost of spawning worker processes.
+PARALLEL_MIN_DOCS = 10000
+
+# Number of documents pre-processed at once by joining them into a single string
+# with the record separator, which must not appear in the documents themselves.
+BATCH_SIZE = 1000
+_RECORD_SEP = '\x1e'
+
+# Patterns and translation table of the default pre-rules, built once at import time
+_TAGS_RE = re.compile('<([^>]+)>')
+_BATCH_TAGS_RE = re.compile('<([^>\x1e]+)>')  # tags must not span over joined documents
+_NUMERIC_RE = re.compile('[0-9]+')
+_DUP_SPACES_RE = re.compile(' {2,}')
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+# digits into spaces and punctuation removed in a single pass, equal to `rm_numeric` followed by
+# `rm_punctuation` once duplicate spaces are removed
+_NUMERIC_PUNCT_TABLE = str.maketrans(string.digits, ' ' * len(string.digits), string.punctuation)
 
 ENGLISH_STOPWORDS = frozenset([
     'a', 'about', 'above', 'across', 'after', 'afterwards', 'again', 'against', 'all', 'almost', 'alone',
@@ -99,14 +122,14 @@ class Tokenizer():
         """
         raise NotImplementedError
 
-    def batch_tokenize(self, texts: List[str]) -> List[List[str]]:
+    def batch_tokenize(self, texts: Iterable[str]) -> List[List[str]]:
         """
         Splitting a corpus with multiple text documents.
 
         Parameters
         ----------
-        texts: List[str], required
-            Input list of texts to be tokenized.
+        texts: Iterable[str], required
+            Input texts to be tokenized.
 
         Returns
         -------
@@ -115,36 +138,67 @@ class Tokenizer():
         raise NotImplementedError
 
 
+def lower(t: str) -> str:
+    """
+    Convert all characters of `t` into lowercase.
+    """
+    return t.lower()
+
+
 def rm_tags(t: str) -> str:
     """
     Remove html tags.
     e,g, rm_tags("<i>Hello</i> <b>World</b>!") -> "Hello World".
     """
-    return re.sub('<([^>]+)>', '', t)
+    return _TAGS_RE.sub('', t)
 
 
 def rm_numeric(t: str) -> str:
     """
     Remove digits from `t`.
     """
-    return re.sub('[0-9]+', ' ', t)
+    return _NUMERIC_RE.sub(' ', t)
 
 
 def rm_punctuation(t: str) -> str:
     """
     Remove "!"#$%&'()*+,-./:;<=>?@[\]^_`{|}~" from t.
     """
-    return t.translate(str.maketrans('', '', string.punctuation))
+    return t.translate(_PUNCT_TABLE)
 
 
 def rm_dup_spaces(t: str) -> str:
     """
     Remove duplicate spaces in `t`.
     """
-    return re.sub(' {2,}', ' ', t)
+    return _DUP_SPACES_RE.sub(' ', t)
+
+
+DEFAULT_PRE_RULES = [lower, rm_tags, rm_numeric, rm_punctuation, rm_dup_spaces]
+
+
+def _batches(texts: Iterable[str], batch_size: int):
+    """Yield lists of at most `batch_size` consecutive texts."""
+    texts = iter(texts)
+    batch = list(islice(texts, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(texts, batch_size))
+
+
+_worker_tokenizer = None
+
+
+def _init_tokenizer_worker(tokenizer):
+    """Bind the tokenizer once per worker process, so it does not need
+    to be pickled together with every chunk of texts.
+    """
+    global _worker_tokenizer
+    _worker_tokenizer = tokenizer
 
 
-DEFAULT_PRE_RULES = [lambda t: t.lower(), rm_tags, rm_numeric, rm_punctuation, rm_dup_spaces]
+def _worker_tokenize_batch(texts: List[str]) -> List[List[str]]:
+    return _worker_tokenizer._tokenize_chunk(texts)
 
 
 class BaseTokenizer(Tokenizer):
@@ -163,14 +217,93 @@ class BaseTokenizer(Tokenizer):
         List of stop-words to be ignored during tokenization,
         or key of built-in stop-word lists (e.g., english).
 
+    n_jobs: int, optional, default: 1
+        Number of parallel processes for batch tokenization. If n_jobs=0, all CPU cores
+        will be utilized. Corpora smaller than `PARALLEL_MIN_DOCS` are always tokenized
+        serially. Provided `pre_rules` have to be picklable for parallel tokenization.
+        `CountVectorizer` also uses it as the number of threads for counting tokens.
+
+    cache_size: int, optional, default: 0
+        Maximum number of distinct texts whose tokens are cached, repeated texts
+        (e.g., identical item descriptions) are then tokenized only once.
+        If cache_size=0, caching is disabled.
+
     """
 
     def __init__(self, sep: str = ' ',
                  pre_rules: List[Callable[[str], str]] = None,
-                 stop_words: Union[List, str] = None):
+                 stop_words: Union[List, str] = None,
+                 n_jobs: int = 1,
+                 cache_size: int = 0):
+        self._cache = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self.cache_size = cache_size
         self.sep = sep
         self.pre_rules = DEFAULT_PRE_RULES if pre_rules is None else pre_rules
         self.stop_words = _validate_stopwords(stop_words)
+        if n_jobs > 0 and n_jobs < multiprocessing.cpu_count():
+            self.n_jobs = n_jobs
+        else:
+            self.n_jobs = multiprocessing.cpu_count()
+
+    @property
+    def sep(self):
+        return self.__sep
+
+    @sep.setter
+    def sep(self, input_sep):
+        """Set separator, cached tokens split by the previous one are dropped.
+        """
+        self.__sep = input_sep
+        self.clear_cache()
+
+    @property
+    def stop_words(self):
+        return self.__stop_words
+
+    @stop_words.setter
+    def stop_words(self, input_stop_words):
+        """Set stop-words, cached tokens filtered by previous ones are dropped.
+        """
+        self.__stop_words = input_stop_words
+        self.clear_cache()
+
+    @property
+    def pre_rules(self):
+        return self.__pre_rules
+
+    @pre_rules.setter
+    def pre_rules(self, input_rules):
+        """Set pre-rules, cached tokens produced by previous rules are dropped.
+        Rules are stored as a tuple, so they can only be changed by assigning them again.
+        """
+        self.__pre_rules = tuple(input_rules)
+        # resolved once here instead of comparing the rules for every batch
+        self._default_rules = self.__pre_rules == tuple(DEFAULT_PRE_RULES)
+        self.clear_cache()
+
+    def __getstate__(self):
+        # cached tokens are not shipped to worker processes or saved with the tokenizer
+        state = self.__dict__.copy()
+        state['_cache'] = OrderedDict()
+        return state
+
+    def cache_info(self):
+        """Return statistics of the tokenization cache.
+
+        Returns
+        -------
+        (hits, misses, cache_size, current_size): Tuple[int, int, int, int]
+        """
+        return self._cache_hits, self._cache_misses, self.cache_size, len(self._cache)
+
+    def clear_cache(self):
+        """Remove all cached tokens and reset cache statistics.
+        """
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def tokenize(self, t: str) -> List[str]:
         """
@@ -185,28 +318,119 @@ class BaseTokenizer(Tokenizer):
         -------
         tokens : ``List[str]``
         """
-        for rule in self.pre_rules:
-            t = rule(t)
+        return self._tokenize_batch([t])[0]
+
+    def _split(self, t: str) -> List[str]:
         tokens = t.split(self.sep)
         if self.stop_words is not None:
             tokens = [tok for tok in tokens if tok not in self.stop_words]
         return tokens
 
-    # TODO: this function can be parallelized
-    def batch_tokenize(self, texts: List[str]) -> List[List[str]]:
+    def _tokenize_chunk(self, texts: List[str]) -> List[List[str]]:
+        """Tokenize a chunk of texts for `batch_tokenize`. Subclasses overriding `tokenize`
+        get their own method called for every text instead of the batched processing.
+        """
+        if type(self).tokenize is not BaseTokenizer.tokenize:
+            return [self.tokenize(t) for t in texts]
+        return self._tokenize_batch(texts)
+
+    def _tokenize_batch(self, texts: List[str]) -> List[List[str]]:
+        """Tokenize a list of texts, only texts which are not cached yet are processed.
+        """
+        if self.cache_size <= 0:
+            return self._tokenize_texts(texts)
+
+        cache = self._cache
+        found = {}
+        misses = []
+        for t in dict.fromkeys(texts):
+            tokens = cache.get(t)
+            if tokens is None:
+                misses.append(t)
+            else:
+                cache.move_to_end(t)
+                found[t] = tokens
+        self._cache_hits += len(texts) - len(misses)
+        self._cache_misses += len(misses)
+
+        for t, tokens in zip(misses, self._tokenize_texts(misses)):
+            found[t] = cache[t] = tokens
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+        # every text gets its own list, the cached ones are never handed out
+        return [found[t].copy() for t in texts]
+
+    def _tokenize_texts(self, texts: List[str]) -> List[List[str]]:
+        """Tokenize a list of texts. With the default pre-rules, texts are joined
+        and each rule is applied only once on the whole batch.
+        """
+        if self._default_rules:
+            joined = _RECORD_SEP.join(texts)
+            if joined.count(_RECORD_SEP) == len(texts) - 1:
+                joined = _BATCH_TAGS_RE.sub('', joined.lower())
+                joined = rm_dup_spaces(joined.translate(_NUMERIC_PUNCT_TABLE))
+                return [self._split(t) for t in joined.split(_RECORD_SEP)]
+
+        pre_rules = self.pre_rules
+        sequences = []
+        for t in texts:
+            for rule in pre_rules:
+                t = rule(t)
+            sequences.append(self._split(t))
+        return sequences
+
+    def batch_tokenize(self, texts: Iterable[str]) -> List[List[str]]:
         """
         Splitting a corpus with multiple text documents.
 
         Parameters
         ----------
-        texts: List[str], required
-            Input list of texts to be tokenized.
+        texts: Iterable[str], required
+            Input texts to be tokenized. It can also be a generator,
+            texts are then consumed while being tokenized.
 
         Returns
         -------
         tokens : ``List[List[str]]``
         """
-        return [self.tokenize(t) for t in texts]
+        if self.n_jobs > 1:
+            if hasattr(texts, '__len__'):
+                num_texts = len(texts)
+            else:  # only look ahead far enough to decide whether parallelism pays off
+                texts = iter(texts)
+                head = list(islice(texts, PARALLEL_MIN_DOCS))
+                num_texts = len(head)
+                texts = chain(head, texts)
+
+            if num_texts >= PARALLEL_MIN_DOCS:
+                # each worker receives a few large chunks of batches to keep the IPC overhead low
+                chunksize = max(1, num_texts // (4 * self.n_jobs * BATCH_SIZE))
+                with multiprocessing.Pool(self.n_jobs, initializer=_init_tokenizer_worker,
+                                          initargs=(self,)) as pool:
+                    return list(chain.from_iterable(
+                        pool.imap(_worker_tokenize_batch, _batches(texts, BATCH_SIZE), chunksize=chunksize)))
+
+        sequences = []
+        for batch in _batches(texts, BATCH_SIZE):
+            sequences.extend(self._tokenize_chunk(batch))
+        return sequences
+
+
+class _TokenIndex(dict):
+    """Token to index mapping which returns `<UNK>` index for unknown tokens
+    without inserting them into the mapping."""
+
+    def __missing__(self, tok):
+        return 1  # 1 is <UNK> idx
+
+
+class _GrowingTokenIndex(dict):
+    """Token to index mapping which adds unknown tokens with the next index."""
+
+    def __missing__(self, tok):
+        idx = self[tok] = len(self)
+        return idx
 
 
 class Vocabulary():
@@ -233,15 +457,12 @@ class Vocabulary():
         """
         Build a mapping between tokens to their integer indices
         """
-        self.tok2idx = defaultdict(int, {tok: idx for idx, tok in enumerate(self.idx2tok)})
+        self.tok2idx = _TokenIndex(zip(self.idx2tok, range(len(self.idx2tok))))
 
     @staticmethod
     def _add_special_tokens(idx2tok: List[str]) -> List[str]:
-        for tok in reversed(SPECIAL_TOKENS):  # <PAD>:0, '<UNK>':1, '<BOS>':2, '<EOS>':3
-            if tok in idx2tok:
-                idx2tok.remove(tok)
-            idx2tok.insert(0, tok)
-        return idx2tok
+        # <PAD>:0, '<UNK>':1, '<BOS>':2, '<EOS>':3
+        return SPECIAL_TOKENS + [tok for tok in idx2tok if tok not in _SPECIAL_TOKENS_SET]
 
     @property
     def size(self):
@@ -261,7 +482,23 @@ class Vocabulary():
             List of integer indices corresponding to input `tokens`.
 
         """
-        return [self.tok2idx.get(tok, 1) for tok in tokens]  # 1 is <UNK> idx
+        return list(map(self.tok2idx.__getitem__, tokens))
+
+    def to_idx_array(self, tokens: List[str]) -> np.ndarray:
+        """Convert a list of `tokens` to a numpy array of their integer indices.
+
+        Parameters
+        ----------
+        tokens: List[str], required
+            List of string tokens.
+
+        Returns
+        -------
+        indices: numpy.ndarray
+            Array of integer indices (int32) corresponding to input `tokens`.
+
+        """
+        return np.fromiter(map(self.tok2idx.__getitem__, tokens), dtype=np.int32, count=len(tokens))
 
     def to_text(self, indices: List[int], sep=' ') -> List[str]:
         """Convert a list of integer `indices` to their tokens.
@@ -280,7 +517,8 @@ class Vocabulary():
             Aggregated text of tokens seperated by `sep`.
 
         """
-        return sep.join([self.idx2tok[i] for i in indices]) if sep is not None else [self.idx2tok[i] for i in indices]
+        tokens = list(map(self.idx2tok.__getitem__, indices))
+        return sep.join(tokens) if sep is not None else tokens
 
     def save(self, path):
         """Save idx2tok into a pickle file.
@@ -291,14 +529,21 @@ class Vocabulary():
             Path to store the dictionary on disk.
 
         """
-        pickle.dump(self.idx2tok, open(path, 'wb'))
+        # tokens are stored as a single newline-joined string which is much faster to load,
+        # unless some tokens contain newlines themselves
+        joined = '\n'.join(self.idx2tok)
+        data = joined if joined.count('\n') == len(self.idx2tok) - 1 else self.idx2tok
+        with open(path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
     def load(cls, path):
         """
         Load a vocabulary from `path` to a pickle file.
         """
-        return cls(pickle.load(open(path, 'rb')))
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        return cls(data.split('\n') if isinstance(data, str) else data)
 
     @classmethod
     def from_tokens(cls, tokens: List[str],
@@ -350,10 +595,31 @@ class Vocabulary():
             If `True`, vocabulary will include `SPECIAL_TOKENS`.
 
         """
-        return Vocabulary.from_tokens([tok for seq in sequences for tok in seq],
+        # tokens are counted while iterating over the sequences, without building a flat list
+        return Vocabulary.from_tokens(chain.from_iterable(sequences),
                                       max_vocab, min_freq, use_special_tokens)
 
 
+def _row_indexer(batch_ids):
+    """Convert a list of integer row ids into an index array, which takes the vectorized
+    row gather of `csr_matrix`. Other indexers (e.g., boolean masks, slices) are kept as they are.
+    """
+    if isinstance(batch_ids, (list, tuple)):
+        ids = np.asarray(batch_ids)
+        if ids.dtype.kind in 'iu':
+            return ids.astype(np.intp, copy=False)
+    return batch_ids
+
+
+def _sequence_offsets(sequences: List[List]) -> np.ndarray:
+    """Offsets of the sequences in their concatenation."""
+    lengths = np.fromiter((len(sequence) for sequence in sequences),
+                          dtype=np.int64, count=len(sequences))
+    offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
 class CountVectorizer():
     """Convert a collection of text documents to a matrix of token counts
     This implementation produces a sparse representation of the counts using
@@ -422,7 +688,7 @@ class CountVectorizer():
         and modifying the vocabulary.
         """
         if max_doc_count >= X.shape[0] and min_doc_count <= 1 and self.max_features is None:
-            return X
+            return X, None
 
         # Calculate a mask based on document frequencies
         doc_freq = np.bincount(X.indices, minlength=X.shape[1])
@@ -439,48 +705,70 @@ class CountVectorizer():
             new_mask[mask_indices] = True
             mask = new_mask
 
-        for index in np.sort(np.where(np.logical_not(mask))[0])[::-1]:
-            del self.vocab.idx2tok[index]
-        self.vocab.build_tok2idx()  # rebuild the mapping
-
         kept_indices = np.where(mask)[0]
         if len(kept_indices) == 0:
             raise ValueError("After pruning, no terms remain. Try a lower"
                              " min_freq or a higher max_doc_freq.")
-        return X[:, kept_indices]
 
-    def _count(self, sequences: List[List[str]]):
+        idx2tok = self.vocab.idx2tok
+        self.vocab.idx2tok = [idx2tok[index] for index in kept_indices.tolist()]
+        self.vocab.build_tok2idx()  # rebuild the mapping
+        return X[:, kept_indices], kept_indices
+
+    def _count(self, sequences: List[List[str]], return_ids: bool = False):
         """
         Create sparse feature matrix of document term counts
         Ignore SPECIAL_TOKENS if used from count matrix
+
+        If `return_ids` is True, vocabulary indices of all tokens looked up while counting
+        are also returned as a flat array (-1 for out-of-vocabulary tokens) together with
+        the offsets of the sequences in it.
         """
-        data = []
-        indices = []
-        indptr = [0]
-        for sequence in sequences:
-            feature_counter = Counter()
-            for token in sequence:
-                if token not in self.vocab.tok2idx.keys():
-                    continue
-                idx = self.vocab.tok2idx[token]
-                if self.vocab.use_special_tokens:
-                    idx -= len(SPECIAL_TOKENS)
-                feature_counter[idx] += 1
-
-            indices.extend(feature_counter.keys())
-            data.extend(feature_counter.values())
-            indptr.append(len(indices))
-
-        feature_dim = self.vocab.size
-        if self.vocab.use_special_tokens:
-            feature_dim -= len(SPECIAL_TOKENS)
-        X = sp.csr_matrix((data, indices, indptr),
-                          shape=(len(sequences), feature_dim),
-                          dtype=np.int64)
-        X.sort_indices()
+        get_idx = self.vocab.tok2idx.get
+        seq_offsets = _sequence_offsets(sequences)
+        ids = np.fromiter((get_idx(token, -1) for token in chain.from_iterable(sequences)),
+                          dtype=np.int32, count=seq_offsets[-1])
+        X = self._count_ids(ids, seq_offsets)
+        if return_ids:
+            return X, ids, seq_offsets
         return X
 
-    def fit(self, raw_documents: List[str]) -> 'CountVectorizer':
+    def _fit_count(self, sequences: List[List[str]]):
+        """
+        Build the vocabulary and the feature matrix in a single pass over the tokens.
+        Tokens are indexed in order of their first occurrence, then re-indexed
+        by decreasing frequency as done by `Vocabulary.from_sequences`.
+        """
+        tok2idx = _GrowingTokenIndex()
+        seq_offsets = _sequence_offsets(sequences)
+        ids = np.fromiter(map(tok2idx.__getitem__, chain.from_iterable(sequences)),
+                          dtype=np.int32, count=seq_offsets[-1])
+
+        # stable sorting keeps ties in order of first occurrence, same as Counter.most_common()
+        order = np.argsort(-np.bincount(ids, minlength=len(tok2idx)), kind='stable')
+        new_ids = np.empty(len(order), dtype=np.int32)
+        new_ids[order] = np.arange(len(order), dtype=np.int32)
+        ids = new_ids[ids]
+
+        tokens = list(tok2idx)
+        self.vocab = Vocabulary([tokens[i] for i in order.tolist()])
+        return self._count_ids(ids, seq_offsets), ids, seq_offsets
+
+    def _count_ids(self, ids: np.ndarray, seq_offsets: np.ndarray):
+        """
+        Create sparse feature matrix from vocabulary indices of the sequences' tokens
+        """
+        offset = len(SPECIAL_TOKENS) if self.vocab.use_special_tokens else 0
+        feature_dim = self.vocab.size - offset
+        # special tokens and out-of-vocabulary tokens (-1) are ignored by the counting kernel,
+        # which runs with as many threads as the tokenizer uses processes
+        data, indices, indptr = csr_count_ids(ids, seq_offsets, feature_dim, id_offset=offset,
+                                              num_threads=getattr(self.tokenizer, 'n_jobs', 1))
+        return sp.csr_matrix((data, indices, indptr),
+                             shape=(len(seq_offsets) - 1, feature_dim),
+                             dtype=np.int32)
+
+    def fit(self, raw_documents: Iterable[str]) -> 'CountVectorizer':
         """Build a vocabulary of all tokens in the raw documents.
 
         Parameters
@@ -497,28 +785,36 @@ class CountVectorizer():
         self.fit_transform(raw_documents)
         return self
 
-    def fit_transform(self, raw_documents: List[str]) -> (List[List[str]], sp.csr_matrix):
+    def fit_transform(self, raw_documents: Iterable[str], return_ids: bool = False):
         """Build the vocabulary and return term-document matrix.
 
         Parameters
         ----------
-        raw_documents : List[str]
+        raw_documents : Iterable[str]
+
+        return_ids: bool, optional, default: False
+            If `True`, vocabulary indices of the tokenized sequences are also returned.
 
         Returns
         -------
-        (sequences, X) :
+        (sequences, X) or (sequences, X, ids, offsets) :
             sequences: List[List[str]
                 Tokenized sequences of raw_documents
             X: array, [n_samples, n_features]
                 Document-term matrix.
+            ids: numpy.ndarray
+                Vocabulary indices of all tokens in `sequences` concatenated,
+                -1 for tokens which are not in the vocabulary.
+            offsets: numpy.ndarray
+                Offsets of the sequences in `ids`, i-th sequence is `ids[offsets[i]:offsets[i + 1]]`.
         """
         sequences = self.tokenizer.batch_tokenize(raw_documents)
 
         fixed_vocab = self.vocab is not None
-        if self.vocab is None:
-            self.vocab = Vocabulary.from_sequences(sequences)
-
-        X = self._count(sequences)
+        if fixed_vocab:
+            X, ids, offsets = self._count(sequences, return_ids=True)
+        else:
+            X, ids, offsets = self._fit_count(sequences)
         if self.binary:
             X.data.fill(1)
 
@@ -530,16 +826,25 @@ class CountVectorizer():
             min_doc_count = (self.min_doc_freq
                              if isinstance(self.min_doc_freq, int)
                              else int(self.min_doc_freq * n_docs))
-            X = self._limit_features(X, max_doc_count, min_doc_count)
-
+            n_features = X.shape[1]
+            X, kept_indices = self._limit_features(X, max_doc_count, min_doc_count)
+            if return_ids and kept_indices is not None:
+                # shift indices of the remaining tokens, pruned ones become out-of-vocabulary,
+                # the extra last entry keeps -1 for tokens already out-of-vocabulary
+                lut = np.full(n_features + 1, -1, dtype=np.int32)
+                lut[kept_indices] = np.arange(len(kept_indices), dtype=np.int32)
+                ids = lut[ids]
+
+        if return_ids:
+            return sequences, X, ids, offsets
         return sequences, X
 
-    def transform(self, raw_documents: List[str]) -> (List[List[str]], sp.csr_matrix):
+    def transform(self, raw_documents: Iterable[str]) -> (List[List[str]], sp.csr_matrix):
         """Transform documents to document-term matrix.
 
         Parameters
         ----------
-        raw_documents : List[str]
+        raw_documents : Iterable[str]
 
         Returns
         -------
@@ -678,7 +983,7 @@ class TfidfVectorizer(CountVectorizer):
 
         return X
 
-    def fit(self, raw_documents: List[str]) -> 'TfidfVectorizer':
+    def fit(self, raw_documents: Iterable[str]) -> 'TfidfVectorizer':
         """Build a vocabulary of all tokens in the raw documents.
 
         Parameters
@@ -695,12 +1000,12 @@ class TfidfVectorizer(CountVectorizer):
         self.fit_transform(raw_documents)
         return self
 
-    def fit_transform(self, raw_documents: List[str]) -> (List[List[str]], sp.csr_matrix):
+    def fit_transform(self, raw_documents: Iterable[str]) -> (List[List[str]], sp.csr_matrix):
         """Build the vocabulary and return term-document matrix.
 
         Parameters
         ----------
-        raw_documents : List[str]
+        raw_documents : Iterable[str]
 
         Returns
         -------
@@ -715,12 +1020,12 @@ class TfidfVectorizer(CountVectorizer):
 
         return self._transform(X)
 
-    def transform(self, raw_documents: List[str]) -> (List[List[str]], sp.csr_matrix):
+    def transform(self, raw_documents: Iterable[str]) -> (List[List[str]], sp.csr_matrix):
         """Transform documents to document-term matrix.
 
         Parameters
         ----------
-        raw_documents : List[str]
+        raw_documents : Iterable[str]
 
         Returns
         -------
@@ -815,6 +1120,43 @@ class TextModality(FeatureModality):
         self.count_matrix = None
         self.__tfidf_matrix = None
 
+    @property
+    def sequences(self):
+        """Return list of token index sequences.
+        Sequences are stored in a flat array `sequences_flat` with `sequences_offsets`
+        marking the boundary of each sequence, the list is only built on first access.
+        """
+        if self.__sequences is None and self.sequences_flat is not None:
+            flat = self.sequences_flat.tolist()
+            offsets = self.sequences_offsets.tolist()
+            self.__sequences = [flat[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+        return self.__sequences
+
+    @sequences.setter
+    def sequences(self, input_sequences):
+        """Set token index sequences, they are stored in a flat array `sequences_flat`
+        with `sequences_offsets` marking the boundary of each sequence for fast batch retrieval.
+        """
+        self.__sequences = input_sequences
+        if input_sequences is None:
+            self.sequences_flat = None
+            self.sequences_offsets = None
+            return
+
+        lengths = np.fromiter((len(seq) for seq in input_sequences),
+                              dtype=np.int64, count=len(input_sequences))
+        self.sequences_offsets = np.zeros(len(input_sequences) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.sequences_offsets[1:])
+        self.sequences_flat = np.fromiter(chain.from_iterable(input_sequences),
+                                          dtype=np.int32, count=self.sequences_offsets[-1])
+
+    def _set_sequences(self, flat, offsets):
+        """Set token index sequences from their flat representation.
+        """
+        self.__sequences = None
+        self.sequences_flat = flat
+        self.sequences_offsets = offsets
+
     @property
     def tfidf_matrix(self):
         """Return tf-idf matrix.
@@ -832,7 +1174,18 @@ class TextModality(FeatureModality):
                                  else {**self.tfidf_params, **params})
 
             vectorizer = TfidfVectorizer(**self.tfidf_params)
-            self.__tfidf_matrix = vectorizer.fit_transform(self.corpus)
+            if self.count_matrix is None:
+                self.__tfidf_matrix = vectorizer.fit_transform(self.corpus)
+            else:
+                # term counts over the same vocabulary are already built, reuse them
+                # instead of tokenizing the corpus again
+                X = self.count_matrix
+                if vectorizer.binary:
+                    X = X.copy()
+                    X.data.fill(1)
+                if vectorizer.use_idf:
+                    vectorizer._build_idf(X)
+                self.__tfidf_matrix = vectorizer._transform(X)
 
         return self.__tfidf_matrix
 
@@ -861,11 +1214,13 @@ class TextModality(FeatureModality):
         vectorizer = CountVectorizer(tokenizer=self.tokenizer, vocab=self.vocab,
                                      max_doc_freq=self.max_doc_freq, min_doc_freq=self.min_doc_freq,
                                      max_features=self.max_vocab, binary=False)
-        self.sequences, self.count_matrix = vectorizer.fit_transform(self.corpus)
+        _, self.count_matrix, ids, offsets = vectorizer.fit_transform(self.corpus, return_ids=True)
         self.vocab = Vocabulary(vectorizer.vocab.idx2tok, use_special_tokens=True)
-        # Map tokens into integer ids
-        for i, seq in enumerate(self.sequences):
-            self.sequences[i] = self.vocab.to_idx(seq)
+
+        # Translate token ids of the vectorizer into ids of our vocabulary,
+        # the extra last entry maps out-of-vocabulary tokens (-1) into <UNK>
+        lut = np.append(self.vocab.to_idx_array(vectorizer.vocab.idx2tok), np.int32(1))
+        self._set_sequences(lut[ids], offsets)
 
         # Reset other lazy-built properties (e.g. tfidf)
         self.__tfidf_matrix = None
@@ -908,19 +1263,22 @@ class TextModality(FeatureModality):
             Batch of sequences with zero-padding at the end.
 
         """
-        if self.sequences is None:
+        if self.sequences_flat is None:
             raise ValueError('self.sequences is required but None!')
 
-        if max_length is None:
-            max_length = max(len(self.sequences[mapped_id]) for mapped_id in batch_ids)
+        n_docs = len(self.sequences_offsets) - 1
+        batch_ids = np.asarray(batch_ids, dtype=np.int64)
+        # negative ids count from the end, as with list indexing
+        batch_ids = np.where(batch_ids < 0, batch_ids + n_docs, batch_ids)
+        # the gather kernel does not check bounds
+        if np.any((batch_ids < 0) | (batch_ids >= n_docs)):
+            raise IndexError('batch_ids out of range for {} sequences'.format(n_docs))
 
-        seq_mat = np.zeros((len(batch_ids), max_length), dtype=np.int)
-        for i, mapped_id in enumerate(batch_ids):
-            idx_seq = self.sequences[mapped_id][:max_length]
-            for j, idx in enumerate(idx_seq):
-                seq_mat[i, j] = idx
+        lengths = self.sequences_offsets[batch_ids + 1] - self.sequences_offsets[batch_ids]
+        if max_length is None:
+            max_length = lengths.max() if len(lengths) > 0 else 0
 
-        return seq_mat
+        return gather_sequences(self.sequences_flat, self.sequences_offsets, batch_ids, max_length)
 
     @fallback_feature
     def batch_bow(self, batch_ids, binary=False, keep_sparse=False):
@@ -928,11 +1286,12 @@ class TextModality(FeatureModality):
 
         Parameters
         ----------
-        batch_ids: array
+        batch_ids: Union[List, numpy.array], required
             An array of ids to retrieve the corresponding features.
 
         binary: bool, default = False
-            If `True`, the feature values will be converted into (0 or 1).
+            If `True`, the feature values will be converted into (0 or 1)
+            and stored as `numpy.int8`.
 
         keep_sparse: bool, default = False
             If `True`, the return feature matrix will be a `scipy.sparse.csr_matrix`.
@@ -947,9 +1306,11 @@ class TextModality(FeatureModality):
         if self.count_matrix is None:
             raise ValueError('self.count_matrix is required but None!')
 
-        bow_mat = self.count_matrix[batch_ids]
+        bow_mat = self.count_matrix[_row_indexer(batch_ids)]
         if binary:
-            bow_mat.data.fill(1)
+            # only the sparsity structure is needed, share it with a matrix of int8 ones
+            bow_mat = sp.csr_matrix((np.ones(bow_mat.nnz, dtype=np.int8), bow_mat.indices, bow_mat.indptr),
+                                    shape=bow_mat.shape, copy=False)
 
         return bow_mat if keep_sparse else bow_mat.A
 
@@ -958,7 +1319,7 @@ class TextModality(FeatureModality):
 
         Parameters
         ----------
-        batch_ids: array
+        batch_ids: Union[List, numpy.array], required
             An array of ids to retrieve the corresponding features.
 
         keep_sparse: bool, default = False
@@ -971,7 +1332,7 @@ class TextModality(FeatureModality):
             Batch of TF-IDF representations corresponding to input `batch_ids`.
 
         """
-        tfidf_mat = self.tfidf_matrix[batch_ids]
+        tfidf_mat = self.tfidf_matrix[_row_indexer(batch_ids)]
         return tfidf_mat if keep_sparse else tfidf_mat.A
 
 class ReviewModality(TextModality):
@@ -14,6 +14,8 @@
 # ============================================================================
 
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+import multiprocessing
 import time
 
 import numpy as np
@@ -68,19 +70,20 @@ def rating_eval(model, metrics, test_set, user_based=False, verbose=False):
     user_results = []
 
     (u_indices, i_indices, r_values) = test_set.uir_tuple
-    r_preds = np.fromiter(
-        tqdm(
-            (
-                model.rate(user_idx, item_idx).item()
-                for user_idx, item_idx in zip(u_indices, i_indices)
-            ),
-            desc="Rating",
-            disable=not verbose,
-            miniters=100,
-            total=len(u_indices),
-        ),
-        dtype=np.float,
-    )
+
+    # ratings are predicted in one batch per user, then put back into the original order
+    u_indices = np.asarray(u_indices)
+    i_indices = np.asarray(i_indices)
+    r_preds = np.empty(len(u_indices), dtype=np.float64)
+    order = np.argsort(u_indices, kind="stable")
+    bounds = np.flatnonzero(np.diff(u_indices[order])) + 1
+    for batch in tqdm(
+        np.split(order, bounds) if len(order) > 0 else [],
+        desc="Rating",
+        disable=not verbose,
+        miniters=100,
+    ):
+        r_preds[batch] = model.rate_batch(u_indices[batch[0]], i_indices[batch])
 
     gt_mat = test_set.csr_matrix
     pd_mat = csr_matrix((r_preds, (u_indices, i_indices)), shape=gt_mat.shape)
@@ -113,6 +116,7 @@ def ranking_eval(
     rating_threshold=1.0,
     exclude_unknowns=True,
     verbose=False,
+    num_threads=1,
 ):
     """Evaluate model on provided ranking metrics.
 
@@ -144,6 +148,11 @@ def ranking_eval(
     verbose: bool, optional, default: False
         Output evaluation progress.
 
+    num_threads: int, optional, default: 1
+        Number of threads used to evaluate users in parallel. If num_threads=0,
+        all CPU cores will be utilized. The model has to support concurrent calls
+        of `rank()` for num_threads other than 1.
+
     Returns
     -------
     res: (List, List)
@@ -156,6 +165,9 @@ def ranking_eval(
     if len(metrics) == 0:
         return [], []
 
+    if num_threads <= 0 or num_threads > multiprocessing.cpu_count():
+        num_threads = multiprocessing.cpu_count()
+
     avg_results = []
     user_results = [{} for _ in enumerate(metrics)]
 
@@ -163,44 +175,58 @@ def ranking_eval(
     train_mat = train_set.csr_matrix
     val_mat = None if val_set is None else val_set.csr_matrix
 
-    def pos_items(csr_row):
-        return [
-            item_idx
-            for (item_idx, rating) in zip(csr_row.indices, csr_row.data)
-            if rating >= rating_threshold
-        ]
+    def pos_items(csr_mat, user_idx):
+        start, end = csr_mat.indptr[user_idx], csr_mat.indptr[user_idx + 1]
+        return csr_mat.indices[start:end][csr_mat.data[start:end] >= rating_threshold]
 
-    for user_idx in tqdm(
-        test_set.user_indices, desc="Ranking", disable=not verbose, miniters=100
-    ):
-        test_pos_items = pos_items(gt_mat.getrow(user_idx))
+    def eval_user(user_idx):
+        test_pos_items = pos_items(gt_mat, user_idx)
         if len(test_pos_items) == 0:
-            continue
-
-        u_gt_pos = np.zeros(test_set.num_items, dtype=np.int)
-        u_gt_pos[test_pos_items] = 1
+            return user_idx, None
 
-        val_pos_items = [] if val_mat is None else pos_items(val_mat.getrow(user_idx))
-        train_pos_items = (
-            []
-            if train_set.is_unk_user(user_idx)
-            else pos_items(train_mat.getrow(user_idx))
-        )
+        u_gt_pos = np.zeros(test_set.num_items, dtype=np.bool_)
+        u_gt_pos[test_pos_items] = True
 
-        u_gt_neg = np.ones(test_set.num_items, dtype=np.int)
-        u_gt_neg[test_pos_items + val_pos_items + train_pos_items] = 0
+        u_gt_neg = np.ones(test_set.num_items, dtype=np.bool_)
+        u_gt_neg[test_pos_items] = False
+        if val_mat is not None:
+            u_gt_neg[pos_items(val_mat, user_idx)] = False
+        if not train_set.is_unk_user(user_idx):
+            u_gt_neg[pos_items(train_mat, user_idx)] = False
 
         item_indices = None if exclude_unknowns else np.arange(test_set.num_items)
         item_rank, item_scores = model.rank(user_idx, item_indices)
 
-        for i, mt in enumerate(metrics):
-            mt_score = mt.compute(
+        mt_scores = [
+            mt.compute(
                 gt_pos=u_gt_pos,
                 gt_neg=u_gt_neg,
                 pd_rank=item_rank,
                 pd_scores=item_scores,
             )
-            user_results[i][user_idx] = mt_score
+            for mt in metrics
+        ]
+        return user_idx, mt_scores
+
+    def collect(results):
+        for user_idx, mt_scores in tqdm(
+            results,
+            desc="Ranking",
+            disable=not verbose,
+            miniters=100,
+            total=len(test_set.user_indices),
+        ):
+            if mt_scores is None:
+                continue
+            for i, mt_score in enumerate(mt_scores):
+                user_results[i][user_idx] = mt_score
+
+    if num_threads == 1:
+        collect(map(eval_user, test_set.user_indices))
+    else:
+        # results are collected in the order of test users, as in the serial evaluation
+        with ThreadPool(num_threads) as pool:
+            collect(pool.imap(eval_user, test_set.user_indices, chunksize=16))
 
     # avg results of ranking metrics
     for i, mt in enumerate(metrics):
@@ -230,6 +256,10 @@ class BaseMethod:
     verbose: bool, optional, default: False
         Output running log.
 
+    num_threads: int, optional, default: 1
+        Number of threads used for ranking evaluation of test users.
+        If num_threads=0, all CPU cores will be utilized.
+
     """
 
     def __init__(
@@ -240,6 +270,7 @@ class BaseMethod:
         seed=None,
         exclude_unknowns=True,
         verbose=False,
+        num_threads=1,
         **kwargs
     ):
         self._data = data
@@ -250,6 +281,7 @@ class BaseMethod:
         self.rating_threshold = rating_threshold
         self.exclude_unknowns = exclude_unknowns
         self.verbose = verbose
+        self.num_threads = num_threads
         self.seed = seed
         self.rng = get_rng(seed)
         self.global_uid_map = OrderedDict()
@@ -610,6 +642,7 @@ class BaseMethod:
             rating_threshold=self.rating_threshold,
             exclude_unknowns=self.exclude_unknowns,
             verbose=self.verbose,
+            num_threads=self.num_threads,
         )
         for i, mt in enumerate(self.ranking_metrics):
             metric_avg_results[mt.name] = avg_results[i]
@@ -1,6 +1,8 @@
 import time
 from collections import defaultdict
 from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
+import multiprocessing
 
 import powerlaw
 import numpy as np
@@ -23,6 +25,7 @@ def ranking_eval(
     exclude_unknowns=True,
     verbose=False,
     props=None,
+    num_threads=1,
 ):
     """Evaluate model on provided ranking metrics.
     
@@ -56,6 +59,11 @@ def ranking_eval(
         
     props: dictionary, optional, default: None
         items propensity scores
+
+    num_threads: int, optional, default: 1
+        Number of threads used to evaluate users in parallel. If num_threads=0,
+        all CPU cores will be utilized. The model has to support concurrent calls
+        of `rank()` for num_threads other than 1.
         
     Returns
     -------
@@ -68,6 +76,9 @@ def ranking_eval(
     if len(metrics) == 0:
         return [], []
 
+    if num_threads <= 0 or num_threads > multiprocessing.cpu_count():
+        num_threads = multiprocessing.cpu_count()
+
     avg_results = []
     user_results = [{} for _ in enumerate(metrics)]
 
@@ -75,30 +86,24 @@ def ranking_eval(
     train_mat = train_set.csr_matrix
     val_mat = None if val_set is None else val_set.csr_matrix
 
-    def pos_items(csr_row):
-        return [
-            item_idx
-            for (item_idx, rating) in zip(csr_row.indices, csr_row.data)
-            if rating >= rating_threshold
-        ]
+    def pos_items(csr_mat, user_idx):
+        start, end = csr_mat.indptr[user_idx], csr_mat.indptr[user_idx + 1]
+        return csr_mat.indices[start:end][csr_mat.data[start:end] >= rating_threshold]
 
-    for user_idx in tqdm.tqdm(test_set.user_indices, disable=not verbose, miniters=100):
-        test_pos_items = pos_items(gt_mat.getrow(user_idx))
+    def eval_user(user_idx):
+        test_pos_items = pos_items(gt_mat, user_idx)
         if len(test_pos_items) == 0:
-            continue
+            return user_idx, None
 
-        u_gt_pos = np.zeros(test_set.num_items, dtype=np.float)
+        u_gt_pos = np.zeros(test_set.num_items, dtype=np.float64)
         u_gt_pos[test_pos_items] = 1
 
-        val_pos_items = [] if val_mat is None else pos_items(val_mat.getrow(user_idx))
-        train_pos_items = (
-            []
-            if train_set.is_unk_user(user_idx)
-            else pos_items(train_mat.getrow(user_idx))
-        )
-
-        u_gt_neg = np.ones(test_set.num_items, dtype=np.int)
-        u_gt_neg[test_pos_items + val_pos_items + train_pos_items] = 0
+        u_gt_neg = np.ones(test_set.num_items, dtype=np.bool_)
+        u_gt_neg[test_pos_items] = False
+        if val_mat is not None:
+            u_gt_neg[pos_items(val_mat, user_idx)] = False
+        if not train_set.is_unk_user(user_idx):
+            u_gt_neg[pos_items(train_mat, user_idx)] = False
 
         item_indices = None if exclude_unknowns else np.arange(test_set.num_items)
         item_rank, item_scores = model.rank(user_idx, item_indices)
@@ -110,15 +115,35 @@ def ranking_eval(
                     u_gt_pos[idx] /= props[str(idx)]
                     total_pi += 1 / props[str(idx)]
 
-        for i, mt in enumerate(metrics):
-            mt_score = mt.compute(
+        mt_scores = [
+            mt.compute(
                 gt_pos=u_gt_pos,
                 gt_neg=u_gt_neg,
                 pd_rank=item_rank,
                 pd_scores=item_scores,
             )
-
-            user_results[i][user_idx] = mt_score
+            for mt in metrics
+        ]
+        return user_idx, mt_scores
+
+    def collect(results):
+        for user_idx, mt_scores in tqdm.tqdm(
+            results,
+            disable=not verbose,
+            miniters=100,
+            total=len(test_set.user_indices),
+        ):
+            if mt_scores is None:
+                continue
+            for i, mt_score in enumerate(mt_scores):
+                user_results[i][user_idx] = mt_score
+
+    if num_threads == 1:
+        collect(map(eval_user, test_set.user_indices))
+    else:
+        # results are collected in the order of test users, as in the serial evaluation
+        with ThreadPool(num_threads) as pool:
+            collect(pool.imap(eval_user, test_set.user_indices, chunksize=16))
 
     # avg results of ranking metrics
     for i, mt in enumerate(metrics):
@@ -159,6 +184,10 @@ class PropensityStratifiedEvaluation(BaseMethod):
     verbose: bool, optional, default: False
         Output running log.
 
+    num_threads: int, optional, default: 1
+        Number of threads used for ranking evaluation of test users.
+        If num_threads=0, all CPU cores will be utilized.
+
     References
     ----------
     Amir H. Jadidinejad, Craig Macdonald and Iadh Ounis, 
@@ -224,6 +253,7 @@ class PropensityStratifiedEvaluation(BaseMethod):
             exclude_unknowns=self.exclude_unknowns,
             verbose=self.verbose,
             props=props,
+            num_threads=self.num_threads,
         )
         for i, mt in enumerate(self.ranking_metrics):
             metric_avg_results[mt.name] = avg_results[i]
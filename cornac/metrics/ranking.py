@@ -117,7 +117,12 @@ class NDCG(RankingMetric):
 
         """
         dcg = self.dcg_score(gt_pos, pd_rank, self.k)
-        idcg = self.dcg_score(gt_pos, np.argsort(gt_pos)[::-1], self.k)
+
+        # ideal ranking only needs the positive items, sorting them is
+        # much cheaper than sorting the whole ground-truth vector
+        pos_indices = np.flatnonzero(gt_pos > 0)
+        ideal_rank = pos_indices[np.argsort(gt_pos[pos_indices], kind="stable")[::-1]]
+        idcg = self.dcg_score(gt_pos, ideal_rank, self.k)
         ndcg = dcg / idcg
 
         return ndcg
@@ -270,12 +275,10 @@ class MeasureAtK(RankingMetric):
         else:
             truncated_pd_rank = pd_rank
 
-        pred = np.zeros_like(gt_pos)
-        pred[truncated_pd_rank] = 1
-
-        tp = np.sum(pred * gt_pos)
+        # only the top@k items are looked up instead of building a full prediction vector
+        tp = np.sum(gt_pos[truncated_pd_rank])
         tp_fn = np.sum(gt_pos)
-        tp_fp = np.sum(pred)
+        tp_fp = len(truncated_pd_rank)
 
         return tp, tp_fn, tp_fp
 
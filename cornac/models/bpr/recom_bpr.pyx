@@ -32,7 +32,7 @@ from ..recommender import Recommender
 from ...exception import ScoreException
 from ...utils import get_rng
 from ...utils import fast_dot
-from ...utils.common import scale
+from ...utils.common import scale, clip
 from ...utils.init_utils import zeros, uniform
 
 
@@ -285,4 +285,36 @@ class BPR(Recommender):
         else:
             item_score = self.i_biases[item_idx]
             item_score += np.dot(self.u_factors[user_idx], self.i_factors[item_idx])
-            return item_score
\ No newline at end of file
+            return item_score
+
+    def rate_batch(self, user_idx, item_indices, clipping=True):
+        """Give rating scores of a user for multiple items at once.
+
+        Parameters
+        ----------
+        user_idx: int, required
+            The index of the user for whom to perform item rating.
+
+        item_indices: 1d array, required
+            The indices of the items to be rated by the user.
+
+        clipping: bool, default: True
+            Whether to clip the predicted rating values.
+
+        Returns
+        -------
+        Numpy 1d array
+            Rating scores of the user for the items
+        """
+        item_indices = np.asarray(item_indices)
+        rating_preds = self.i_biases[item_indices].astype(np.float64)
+        rating_preds += self.i_factors[item_indices].dot(self.u_factors[user_idx])
+
+        if clipping:
+            rating_preds = clip(
+                values=rating_preds,
+                lower_bound=self.train_set.min_rating,
+                upper_bound=self.train_set.max_rating,
+            )
+
+        return rating_preds
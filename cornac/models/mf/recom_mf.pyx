@@ -31,6 +31,7 @@ from ..recommender import Recommender
 from ...exception import ScoreException
 from ...utils import fast_dot
 from ...utils import get_rng
+from ...utils.common import clip
 from ...utils.init_utils import normal, zeros
 
 
@@ -275,3 +276,49 @@ class MF(Recommender):
                     raise ScoreException("Can't make score prediction for (user_id=%d, item_id=%d)" % (user_idx, item_idx))
                 item_score = np.dot(self.u_factors[user_idx], self.i_factors[item_idx])
             return item_score
+
+    def rate_batch(self, user_idx, item_indices, clipping=True):
+        """Give rating scores of a user for multiple items at once.
+
+        Parameters
+        ----------
+        user_idx: int, required
+            The index of the user for whom to perform item rating.
+
+        item_indices: 1d array, required
+            The indices of the items to be rated by the user.
+
+        clipping: bool, default: True
+            Whether to clip the predicted rating values.
+
+        Returns
+        -------
+        Numpy 1d array
+            Rating scores of the user for the items
+        """
+        item_indices = np.asarray(item_indices)
+        unk_user = self.train_set.is_unk_user(user_idx)
+        known_items = np.logical_not(self.train_set.is_unk_item(item_indices))
+        known_item_ids = item_indices[known_items]
+
+        if self.use_bias:
+            rating_preds = np.full(len(item_indices), self.global_mean, dtype=np.float64)
+            if not unk_user:
+                rating_preds += self.u_biases[user_idx]
+            rating_preds[known_items] += self.i_biases[known_item_ids]
+            if not unk_user:
+                rating_preds[known_items] += self.i_factors[known_item_ids].dot(self.u_factors[user_idx])
+        else:
+            # same as rate(), unknown users or items fall back to default score
+            rating_preds = np.full(len(item_indices), self.default_score(), dtype=np.float64)
+            if not unk_user:
+                rating_preds[known_items] = self.i_factors[known_item_ids].dot(self.u_factors[user_idx])
+
+        if clipping:
+            rating_preds = clip(
+                values=rating_preds,
+                lower_bound=self.train_set.min_rating,
+                upper_bound=self.train_set.max_rating,
+            )
+
+        return rating_preds
@@ -18,6 +18,7 @@ import numpy as np
 from ..recommender import Recommender
 from ...utils.common import sigmoid
 from ...utils.common import scale
+from ...utils.common import clip
 from ...exception import ScoreException
 
 
@@ -241,3 +242,50 @@ class PMF(Recommender):
                 )
 
             return user_pred
+
+    def rate_batch(self, user_idx, item_indices, clipping=True):
+        """Give rating scores of a user for multiple items at once.
+
+        Parameters
+        ----------
+        user_idx: int, required
+            The index of the user for whom to perform item rating.
+
+        item_indices: 1d array, required
+            The indices of the items to be rated by the user.
+
+        clipping: bool, default: True
+            Whether to clip the predicted rating values.
+
+        Returns
+        -------
+        Numpy 1d array
+            Rating scores of the user for the items
+        """
+        item_indices = np.asarray(item_indices)
+        # unknown users or items fall back to default score, same as rate()
+        rating_preds = np.full(len(item_indices), self.default_score(), dtype=np.float64)
+        if not self.train_set.is_unk_user(user_idx):
+            known_items = np.logical_not(self.train_set.is_unk_item(item_indices))
+            user_preds = self.V[item_indices[known_items], :].dot(self.U[user_idx, :])
+
+            if self.variant == "non_linear":
+                user_preds = sigmoid(user_preds)
+                user_preds = scale(
+                    user_preds,
+                    self.train_set.min_rating,
+                    self.train_set.max_rating,
+                    0.0,
+                    1.0,
+                )
+
+            rating_preds[known_items] = user_preds
+
+        if clipping:
+            rating_preds = clip(
+                values=rating_preds,
+                lower_bound=self.train_set.min_rating,
+                upper_bound=self.train_set.max_rating,
+            )
+
+        return rating_preds
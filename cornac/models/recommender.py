@@ -235,6 +235,39 @@ class Recommender:
 
         return rating_pred
 
+    def rate_batch(self, user_idx, item_indices, clipping=True):
+        """Give rating scores of a user for multiple items at once.
+        Overwrite this function if your algorithm can score a batch of items
+        more efficiently than one item at a time.
+
+        Parameters
+        ----------
+        user_idx: int, required
+            The index of the user for whom to perform item rating.
+
+        item_indices: 1d array, required
+            The indices of the items to be rated by the user.
+
+        clipping: bool, default: True
+            Whether to clip the predicted rating values.
+
+        Returns
+        -------
+        Numpy 1d array
+            Rating scores of the user for the items
+        """
+        # models overriding rate() may not accept the clipping argument, it is only passed when needed
+        if clipping:
+            preds = (self.rate(user_idx, item_idx) for item_idx in item_indices)
+        else:
+            preds = (self.rate(user_idx, item_idx, clipping=False) for item_idx in item_indices)
+
+        return np.fromiter(
+            (np.asarray(pred).item() for pred in preds),
+            dtype=np.float64,
+            count=len(item_indices),
+        )
+
     def rank(self, user_idx, item_indices=None):
         """Rank all test items for a given user.
 
@@ -18,7 +18,9 @@
 
 cimport cython
 from cython cimport floating
+from cython.parallel import parallel, prange, threadid
 from libc.math cimport fabs, sqrt
+from libcpp.algorithm cimport sort
 
 cimport numpy as np
 import numpy as np
@@ -88,3 +90,105 @@ def _inplace_csr_row_normalize_l2(np.ndarray[floating, ndim=1] X_data,
 
         for j in range(X_indptr[i], X_indptr[i + 1]):
             X_data[j] /= sum_
+
+def csr_count_ids(int[::1] ids, np.int64_t[::1] offsets, int n_features,
+                  int id_offset=0, int num_threads=1):
+    """Build CSR arrays of term counts from token ids of multiple sequences.
+
+    Ids of the i-th sequence are stored in ids[offsets[i]:offsets[i + 1]],
+    ids smaller than `id_offset` (e.g., -1 for unknown tokens) are ignored,
+    others are counted as features (id - id_offset).
+
+    Returns
+    -------
+    (data, indices, indptr): tuple of int32 data and indices with sorted indices in each row,
+    indptr is int64 as the total number of non-zeros may exceed the int32 range.
+    """
+    cdef Py_ssize_t n_rows = offsets.shape[0] - 1
+    cdef Py_ssize_t r, j, start, end
+    cdef int f, nnz, max_id = id_offset - 1
+    cdef int * counts
+
+    for j in range(ids.shape[0]):
+        if ids[j] > max_id:
+            max_id = ids[j]
+    if max_id - id_offset >= n_features:
+        raise ValueError('Token id %d is out of range for %d features' % (max_id, n_features))
+
+    num_threads = max(num_threads, 1)
+    # scratch counts of each thread, allocated here to raise MemoryError rather than failing in threads
+    cdef int[:, ::1] scratch = np.zeros((num_threads, max(n_features, 1)), dtype=np.int32)
+    cdef np.ndarray[np.int64_t, ndim=1] indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    cdef np.int64_t[::1] row_nnz = indptr[1:]
+
+    # first pass: number of distinct features of each row
+    with nogil, parallel(num_threads=num_threads):
+        counts = &scratch[threadid(), 0]
+
+        for r in prange(n_rows, schedule='guided'):
+            nnz = 0
+            for j in range(offsets[r], offsets[r + 1]):
+                f = ids[j] - id_offset
+                if f >= 0:
+                    if counts[f] == 0:
+                        nnz = nnz + 1
+                    counts[f] += 1
+            row_nnz[r] = nnz
+            for j in range(offsets[r], offsets[r + 1]):  # reset scratch counts
+                f = ids[j] - id_offset
+                if f >= 0:
+                    counts[f] = 0
+
+    np.cumsum(indptr, out=indptr)
+    cdef np.ndarray[np.int32_t, ndim=1] indices_arr = np.empty(indptr[n_rows], dtype=np.int32)
+    cdef np.ndarray[np.int32_t, ndim=1] data_arr = np.empty(indptr[n_rows], dtype=np.int32)
+    cdef np.int64_t[::1] row_ptr = indptr
+    cdef int[::1] indices = indices_arr, data = data_arr
+
+    # second pass: distinct features and their counts
+    with nogil, parallel(num_threads=num_threads):
+        counts = &scratch[threadid(), 0]
+
+        for r in prange(n_rows, schedule='guided'):
+            start = row_ptr[r]
+            end = start
+            for j in range(offsets[r], offsets[r + 1]):
+                f = ids[j] - id_offset
+                if f >= 0:
+                    if counts[f] == 0:
+                        indices[end] = f
+                        end = end + 1
+                    counts[f] += 1
+            if end - start > 1:
+                sort(&indices[start], &indices[start] + (end - start))
+            for j in range(start, end):
+                data[j] = counts[indices[j]]
+                counts[indices[j]] = 0
+
+    return data_arr, indices_arr, indptr
+
+
+def gather_sequences(int[::1] flat, np.int64_t[::1] offsets, np.int64_t[::1] rows,
+                     int max_length, int num_threads=1):
+    """Gather sequences of multiple rows into a zero-padded matrix.
+
+    Ids of the i-th sequence are stored in flat[offsets[i]:offsets[i + 1]],
+    sequences longer than `max_length` are truncated.
+
+    Returns
+    -------
+    seq_mat: int32 array of shape (len(rows), max_length).
+    """
+    cdef Py_ssize_t n_rows = rows.shape[0]
+    cdef np.ndarray[np.int32_t, ndim=2] seq_arr = np.zeros((n_rows, max_length), dtype=np.int32)
+    cdef int[:, ::1] seq_mat = seq_arr
+    cdef Py_ssize_t k, j, start, length
+
+    with nogil:
+        for k in prange(n_rows, num_threads=num_threads, schedule='static'):
+            start = offsets[rows[k]]
+            length = min(offsets[rows[k] + 1] - start, max_length)
+            for j in range(length):
+                seq_mat[k, j] = flat[start + j]
+
+    return seq_arr
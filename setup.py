@@ -259,6 +259,8 @@ extensions = [
         sources=["cornac/utils/fast_sparse_funcs" + ext],
         include_dirs=[np.get_include()],
         language="c++",
+        extra_compile_args=compile_args,
+        extra_link_args=link_args,
     ),
 ]
 
@@ -56,6 +56,15 @@ class TestSentimentModality(unittest.TestCase):
         self.assertEqual(len(md.aspect_id_map), 3)
         self.assertEqual(len(md.opinion_id_map), 2)
 
+        user_idx, item_idx = uid_map['76'], iid_map['257']
+        self.assertDictEqual(md.user_sentiment[user_idx], {iid_map['93']: 0, item_idx: 3})
+        self.assertDictEqual(md.item_sentiment[item_idx], {uid_map['768']: 1, user_idx: 3})
+        self.assertNotIn(len(uid_map), md.user_sentiment)
+        self.assertIn(np.int64(user_idx), md.user_sentiment)
+        self.assertNotIn('76', md.user_sentiment)
+        self.assertIsNone(md.user_sentiment.get('76'))
+        self.assertIsNone(md.user_sentiment.get(1.5))
+
         try:
             SentimentModality().build()
         except ValueError:
@@ -13,6 +13,7 @@
 # limitations under the License.
 # ============================================================================
 
+import copy
 import unittest
 from collections import defaultdict
 
@@ -23,6 +24,7 @@ from cornac.data import TextModality, ReviewModality
 from cornac.data.text import (
     SPECIAL_TOKENS,
     DEFAULT_PRE_RULES,
+    PARALLEL_MIN_DOCS,
     BaseTokenizer,
     Vocabulary,
     CountVectorizer,
@@ -48,6 +50,60 @@ class TestBaseTokenizer(unittest.TestCase):
         self.assertListEqual(token_list, [['a', 'b', 'c'],
                                           ['d', 'e', 'f']])
 
+    def test_batch_tokenize_default_rules(self):
+        texts = ['a <b', 'c> d', 'e \x1e <f> g', '']
+        self.assertListEqual(self.tok.batch_tokenize(texts),
+                             [self.tok.tokenize(t) for t in texts])
+        self.assertListEqual(self.tok.batch_tokenize(texts[:2]), [['a', 'b'], ['c', 'd']])
+
+    def test_parallel_batch_tokenize(self):
+        texts = ['<b>A</b> b c', 'd 1 e, f'] * (PARALLEL_MIN_DOCS // 2)
+        tok = BaseTokenizer(n_jobs=2)
+        self.assertListEqual(tok.batch_tokenize(texts), self.tok.batch_tokenize(texts))
+        self.assertListEqual(tok.batch_tokenize(iter(texts)), self.tok.batch_tokenize(texts))
+        self.assertListEqual(tok.batch_tokenize(iter(texts[:2])), self.tok.batch_tokenize(texts[:2]))
+
+    def test_tokenize_override(self):
+        class UpperTokenizer(BaseTokenizer):
+            def tokenize(self, t):
+                return [tok.upper() for tok in super().tokenize(t)]
+
+        tok = UpperTokenizer()
+        self.assertListEqual(tok.batch_tokenize(['a b', 'c']), [['A', 'B'], ['C']])
+
+        vectorizer = CountVectorizer(tokenizer=tok)
+        vectorizer.fit(['a b', 'c'])
+        self.assertCountEqual(vectorizer.vocab.idx2tok, ['A', 'B', 'C'])
+
+    def test_cache(self):
+        tok = BaseTokenizer(cache_size=2)
+        token_list = tok.batch_tokenize(['a b', 'c', 'a b'])
+        self.assertListEqual(token_list, [['a', 'b'], ['c'], ['a', 'b']])
+        self.assertIsNot(token_list[0], token_list[2])
+        self.assertTupleEqual(tok.cache_info(), (1, 2, 2, 2))
+
+        self.assertListEqual(tok.tokenize('d'), ['d'])
+        self.assertListEqual(tok.tokenize('c'), ['c'])  # 'a b' is the least recently used one
+        self.assertTupleEqual(tok.cache_info(), (2, 3, 2, 2))
+        self.assertListEqual(tok.tokenize('a b'), ['a', 'b'])
+        self.assertTupleEqual(tok.cache_info(), (2, 4, 2, 2))
+
+        tok.pre_rules = []
+        self.assertTupleEqual(tok.cache_info(), (0, 0, 2, 0))
+        self.assertListEqual(tok.tokenize('A, b'), ['A,', 'b'])
+
+        tok = BaseTokenizer()
+        self.assertListEqual(tok.batch_tokenize(['a b', 'a b']), [['a', 'b'], ['a', 'b']])
+        self.assertTupleEqual(tok.cache_info(), (0, 0, 0, 0))
+
+    def test_cache_invalidation(self):
+        tok = BaseTokenizer(cache_size=10)
+        self.assertListEqual(tok.tokenize('the cat sat'), ['the', 'cat', 'sat'])
+        tok.stop_words = frozenset(['the'])
+        self.assertListEqual(tok.tokenize('the cat sat'), ['cat', 'sat'])
+        tok.sep = 'a'
+        self.assertListEqual(tok.tokenize('the cat sat'), ['the c', 't s', 't'])
+
     def test_default_rules(self):
         tok = BaseTokenizer(pre_rules=DEFAULT_PRE_RULES)
         token_list = tok.tokenize('<t>a</t> B |{ C ]?&$  d123 E')
@@ -88,6 +144,12 @@ class TestVocabulary(unittest.TestCase):
 
     def test_to_idx(self):
         self.assertEqual(self.vocab.to_idx(self.tok_seq), self.idx_seq)
+        self.assertEqual(self.vocab.to_idx(['a', 'z']), [self.idx_seq[0], 1])  # 1 is <UNK> idx
+        self.assertNotIn('z', self.vocab.tok2idx)
+
+        indices = self.vocab.to_idx_array(self.tok_seq)
+        self.assertEqual(np.int32, indices.dtype)
+        npt.assert_array_equal(indices, self.idx_seq)
 
     def test_to_text(self):
         self.assertEqual(self.vocab.to_text(self.idx_seq), ' '.join(self.tok_seq))
@@ -98,6 +160,10 @@ class TestVocabulary(unittest.TestCase):
         loaded_vocab = Vocabulary.load('tests/vocab.pkl')
         self.assertListEqual(self.vocab.idx2tok, loaded_vocab.idx2tok)
 
+        vocab = Vocabulary(['a', 'b\nc', ''])
+        vocab.save('tests/vocab.pkl')
+        self.assertListEqual(vocab.idx2tok, Vocabulary.load('tests/vocab.pkl').idx2tok)
+
     def test_from_tokens(self):
         from_tokens_vocab = Vocabulary.from_tokens(self.tokens)
         self.assertCountEqual(self.vocab.idx2tok, from_tokens_vocab.idx2tok)
@@ -155,6 +221,27 @@ class TestCountVectorizer(unittest.TestCase):
         _, X2 = vectorizer.transform(self.docs)
         npt.assert_array_equal(X1.A, X2.A)
 
+    def test_iterable_documents(self):
+        vectorizer = CountVectorizer()
+        sequences, X = vectorizer.fit_transform(doc for doc in self.docs)
+        self.assertEqual(len(sequences), len(self.docs))
+        npt.assert_array_equal(X.A, CountVectorizer().fit_transform(self.docs)[1].A)
+
+    def test_large_vocab(self):
+        docs = [' '.join('w{}'.format(j) for j in range(i, 3000, 7)) for i in range(7)] + ['w1 w1 w2']
+        vectorizer = CountVectorizer(tokenizer=BaseTokenizer(pre_rules=[]))
+        _, X = vectorizer.fit_transform(docs)
+        self.assertEqual(X.shape, (8, 3000))
+        npt.assert_array_equal(X.sum(axis=1).A1, [429] * 4 + [428] * 3 + [3])
+        self.assertEqual(X[7, vectorizer.vocab.tok2idx['w1']], 2)
+
+    def test_return_ids(self):
+        vectorizer = CountVectorizer(max_doc_freq=2, min_doc_freq=1, max_features=1)
+        sequences, X, ids, offsets = vectorizer.fit_transform(self.docs, return_ids=True)
+        self.assertListEqual(vectorizer.vocab.idx2tok, ['d'])
+        npt.assert_array_equal(offsets, [0, 3, 7, 12])
+        npt.assert_array_equal(ids, [-1, -1, -1, -1, -1, 0, 0, -1, -1, -1, -1, -1])
+
     def test_with_special_tokens(self):
         vectorizer = CountVectorizer(max_doc_freq=2, min_doc_freq=1, max_features=1)
         vectorizer.fit(self.docs)
@@ -216,14 +303,19 @@ class TestTfidfVectorizer(unittest.TestCase):
 
 class TestTextModality(unittest.TestCase):
 
-    def setUp(self):
-        self.tokens = ['a', 'b', 'c', 'd', 'e', 'f']
+    @classmethod
+    def setUpClass(cls):
+        cls.tokens = ['a', 'b', 'c', 'd', 'e', 'f']
         corpus = ['a b c', 'b c d d', 'c b e c f']
         ids = ['u1', 'u2', 'u3']
         # frequency ranking: c > b > d > a > e > f
-        self.modality = TextModality(corpus=corpus, ids=ids, max_vocab=6)
-        self.modality.build({'u1': 0, 'u2': 1, 'u3': 2})
-        self.token_ids = (self.modality.vocab.tok2idx[tok] for tok in self.tokens)
+        cls.built_modality = TextModality(corpus=corpus, ids=ids, max_vocab=6)
+        cls.built_modality.build({'u1': 0, 'u2': 1, 'u3': 2})
+        cls.token_ids = tuple(cls.built_modality.vocab.tok2idx[tok] for tok in cls.tokens)
+
+    def setUp(self):
+        # tests may reset attributes of the modality, the built one is shared
+        self.modality = copy.copy(self.built_modality)
 
     def test_init(self):
         self.assertCountEqual(self.modality.vocab.idx2tok,
@@ -238,11 +330,21 @@ class TestTextModality(unittest.TestCase):
     def test_sequences(self):
         (a, b, c, d, e, f) = self.token_ids
 
+        self.assertEqual(np.int32, self.modality.sequences_flat.dtype)
+        npt.assert_array_equal(self.modality.sequences_flat,
+                               [a, b, c, b, c, d, d, c, b, e, c, f])
+        npt.assert_array_equal(self.modality.sequences_offsets, [0, 3, 7, 12])
+
         self.assertListEqual(self.modality.sequences,
                              [[a, b, c],
                               [b, c, d, d],
                               [c, b, e, c, f]])
 
+        modality = TextModality()
+        modality.sequences = [[a], [], [b, c]]
+        npt.assert_array_equal(modality.sequences_flat, [a, b, c])
+        npt.assert_array_equal(modality.sequences_offsets, [0, 1, 1, 3])
+
     def test_batch_seq(self):
         (a, b, c, d, e, f) = self.token_ids
 
@@ -258,6 +360,15 @@ class TestTextModality(unittest.TestCase):
                                np.asarray([[a, b, c, 0],
                                            [c, b, e, c]]))
 
+        npt.assert_array_equal(self.modality.batch_seq([-1, -3]),
+                               self.modality.batch_seq([2, 0]))
+
+        for batch_ids in ([3], [0, 10 ** 8], [-4]):
+            with self.assertRaises(IndexError):
+                self.modality.batch_seq(batch_ids)
+            with self.assertRaises(IndexError):
+                self.modality.batch_seq(batch_ids, max_length=3)
+
         self.modality.sequences = None
         try:
             self.modality.batch_seq([0])
@@ -298,11 +409,18 @@ class TestTextModality(unittest.TestCase):
 
         batch_bows = self.modality.batch_bow([0, 2], binary=True, keep_sparse=True)
         self.assertEqual((2, 6), batch_bows.shape)
+        self.assertEqual(np.int8, batch_bows.dtype)
         expected_bows = np.zeros_like(batch_bows.A)
         expected_bows[0, np.asarray([a, b, c]) - shift] = 1
         expected_bows[1, np.asarray([b, c, e, f]) - shift] = 1
         npt.assert_array_equal(batch_bows.A, expected_bows)
 
+        mask = np.asarray([True, False, True])
+        npt.assert_array_equal(self.modality.batch_bow(mask), self.modality.batch_bow([0, 2]))
+        npt.assert_array_equal(self.modality.batch_bow([True, False, True]),
+                               self.modality.batch_bow([0, 2]))
+        npt.assert_array_equal(self.modality.batch_tfidf(mask), self.modality.batch_tfidf([0, 2]))
+
         self.modality.count_matrix = None
         try:
             self.modality.batch_bow([0])
@@ -15,11 +15,13 @@
 
 import unittest
 
-from cornac.eval_methods import BaseMethod
+import numpy as np
+
+from cornac.eval_methods import BaseMethod, rating_eval, ranking_eval
 from cornac.data import FeatureModality, TextModality, ReviewModality, ImageModality, SentimentModality
 from cornac.data import Dataset, Reader
-from cornac.metrics import MAE, AUC
-from cornac.models import MF
+from cornac.metrics import MAE, AUC, NDCG, Recall
+from cornac.models import MF, PMF, Recommender
 
 
 class TestBaseMethod(unittest.TestCase):
@@ -169,6 +171,48 @@ class TestBaseMethod(unittest.TestCase):
         result = bm.evaluate(model, metrics=[MAE()], user_based=False)
         result.__str__()
 
+    def test_rating_eval(self):
+        rng = np.random.RandomState(123)
+        data = [(str(u), str(i), float(rng.randint(1, 6)))
+                for u in range(50) for i in rng.choice(40, size=10, replace=False)]
+        rng.shuffle(data)
+        bm = BaseMethod.from_splits(train_data=data[:400], test_data=data[400:],
+                                    exclude_unknowns=False)
+        (u_indices, i_indices, r_values) = bm.test_set.uir_tuple
+
+        for model in [MF(k=2, max_iter=10, seed=123),
+                      MF(k=2, max_iter=10, use_bias=False, seed=123),
+                      PMF(k=2, max_iter=10, variant='non_linear', seed=123)]:
+            model.verbose = False
+            model.fit(bm.train_set)
+            r_preds = np.asarray([np.asarray(model.rate(u, i)).item()
+                                  for u, i in zip(u_indices, i_indices)])
+            avg_results, _ = rating_eval(model, [MAE()], bm.test_set)
+            self.assertAlmostEqual(avg_results[0], np.mean(np.abs(r_values - r_preds)))
+
+        class ConstantModel(Recommender):
+            def rate(self, user_idx, item_idx):
+                return 3.0
+
+        avg_results, _ = rating_eval(ConstantModel('Constant'), [MAE()], bm.test_set)
+        self.assertAlmostEqual(avg_results[0], np.mean(np.abs(r_values - 3.0)))
+
+    def test_ranking_eval_num_threads(self):
+        rng = np.random.RandomState(123)
+        data = [(str(u), str(i), float(rng.randint(1, 6)))
+                for u in range(50) for i in rng.choice(40, size=10, replace=False)]
+        bm = BaseMethod.from_splits(train_data=data[:400], test_data=data[400:],
+                                    exclude_unknowns=False)
+        model = MF(k=2, max_iter=10, seed=123).fit(bm.train_set)
+        metrics = [AUC(), NDCG(k=3), Recall(k=3)]
+
+        kwargs = dict(model=model, metrics=metrics, train_set=bm.train_set,
+                      test_set=bm.test_set, exclude_unknowns=False)
+        avg_results, user_results = ranking_eval(num_threads=1, **kwargs)
+        mt_avg_results, mt_user_results = ranking_eval(num_threads=2, **kwargs)
+        self.assertListEqual(avg_results, mt_avg_results)
+        self.assertListEqual(user_results, mt_user_results)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,9 +19,11 @@ import numpy as np
 
 import cornac
 from cornac.data import Reader
+from cornac.eval_methods import BaseMethod
 from cornac.eval_methods import PropensityStratifiedEvaluation
+from cornac.eval_methods.propensity_stratified_evaluation import ranking_eval
 from cornac.models import MF
-from cornac.metrics import MAE, AUC
+from cornac.metrics import MAE, AUC, NDCG, Recall
 
 
 class TestPropensityStratifiedEvaluation(unittest.TestCase):
@@ -81,5 +83,24 @@ class TestPropensityStratifiedEvaluation(unittest.TestCase):
         result.__str__()
 
 
+class TestPropensityRankingEval(unittest.TestCase):
+    def test_ranking_eval_num_threads(self):
+        rng = np.random.RandomState(123)
+        data = [(str(u), str(i), float(rng.randint(1, 6)))
+                for u in range(50) for i in rng.choice(40, size=10, replace=False)]
+        bm = BaseMethod.from_splits(train_data=data[:400], test_data=data[400:],
+                                    exclude_unknowns=False)
+        model = MF(k=2, max_iter=10, seed=123).fit(bm.train_set)
+        metrics = [AUC(), NDCG(k=3), Recall(k=3)]
+        props = {str(idx): rng.uniform(0.1, 1.0) for idx in range(bm.test_set.num_items)}
+
+        kwargs = dict(model=model, metrics=metrics, train_set=bm.train_set,
+                      test_set=bm.test_set, exclude_unknowns=False, props=props)
+        avg_results, user_results = ranking_eval(num_threads=1, **kwargs)
+        mt_avg_results, mt_user_results = ranking_eval(num_threads=2, **kwargs)
+        self.assertListEqual(avg_results, mt_avg_results)
+        self.assertListEqual(user_results, mt_user_results)
+
+
 if __name__ == "__main__":
     unittest.main()
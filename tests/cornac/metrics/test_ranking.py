@@ -62,6 +62,9 @@ class TestRanking(unittest.TestCase):
         self.assertEqual(
             0.63, float("{:.2f}".format(ndcg_2.compute(ground_truth, rec_list)))
         )
+        self.assertEqual(
+            0.63, float("{:.2f}".format(ndcg_2.compute(ground_truth.astype(bool), rec_list)))
+        )
 
     def test_ncrr(self):
         ncrr = NCRR()
@@ -0,0 +1,59 @@
+# Copyright 2018 The Cornac Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ============================================================================
+
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+from cornac.utils.fast_sparse_funcs import csr_count_ids, gather_sequences
+
+
+class TestFastSparseFuncs(unittest.TestCase):
+
+    def test_csr_count_ids(self):
+        ids = np.asarray([3, 1, 3, -1, 2, 0, 4, 4, 1], dtype=np.int32)
+        offsets = np.asarray([0, 4, 4, 9], dtype=np.int64)
+
+        data, indices, indptr = csr_count_ids(ids, offsets, 5)
+        self.assertEqual(np.int64, indptr.dtype)
+        npt.assert_array_equal(indptr, [0, 2, 2, 6])
+        npt.assert_array_equal(indices, [1, 3, 0, 1, 2, 4])
+        npt.assert_array_equal(data, [1, 2, 1, 1, 1, 2])
+
+        data, indices, indptr = csr_count_ids(ids, offsets, 3, id_offset=2, num_threads=2)
+        npt.assert_array_equal(indptr, [0, 1, 1, 3])
+        npt.assert_array_equal(indices, [1, 0, 2])
+        npt.assert_array_equal(data, [2, 1, 2])
+
+        data, indices, indptr = csr_count_ids(ids[3:4], offsets[:2] // 4, 0)
+        npt.assert_array_equal(indptr, [0, 0])
+
+        with self.assertRaises(ValueError):
+            csr_count_ids(ids, offsets, 4)
+
+    def test_gather_sequences(self):
+        flat = np.asarray([5, 6, 7, 8, 9, 4], dtype=np.int32)
+        offsets = np.asarray([0, 3, 3, 6], dtype=np.int64)
+
+        seq_mat = gather_sequences(flat, offsets, np.asarray([2, 1, 0], dtype=np.int64), 4)
+        npt.assert_array_equal(seq_mat, [[8, 9, 4, 0], [0, 0, 0, 0], [5, 6, 7, 0]])
+
+        seq_mat = gather_sequences(flat, offsets, np.asarray([0, 0], dtype=np.int64), 2, num_threads=2)
+        npt.assert_array_equal(seq_mat, [[5, 6], [5, 6]])
+
+
+if __name__ == '__main__':
+    unittest.main()